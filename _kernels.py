@@ -0,0 +1,52 @@
+"""
+Numeric kernels for pause detection and scoring, compiled with Numba.
+
+cache=True stores the compiled machine code on disk, and both kernels are
+compiled at import, so no request ever waits on the JIT.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def find_pauses(starts, ends, threshold, context_seconds):
+    """
+    One pass over word timings: indices i where the gap before word i is
+    at least threshold seconds, the length of each of those gaps, and the
+    index of the first word starting within context_seconds of word i.
+
+    Word starts are sorted, so the context window's left edge only ever
+    moves forward: O(words) total, no rescans per pause.
+    """
+    n = starts.shape[0]
+    indices = np.empty(max(n - 1, 0), dtype=np.int64)
+    gaps = np.empty(max(n - 1, 0), dtype=np.float64)
+    firsts = np.empty(max(n - 1, 0), dtype=np.int64)
+    count = 0
+    first = 0
+
+    for i in range(1, n):
+        gap = starts[i] - ends[i - 1]
+        if gap >= threshold:
+            while starts[first] < starts[i] - context_seconds:
+                first += 1
+            indices[count] = i
+            gaps[count] = gap
+            firsts[count] = first
+            count += 1
+
+    return indices[:count], gaps[:count], firsts[:count]
+
+
+@njit(cache=True, fastmath=True)
+def fluency_score(total_pause_time, pause_count, word_count):
+    """Penalize long/frequent pauses: 5 points per second, 10 per pause."""
+    if word_count > 0:
+        return max(0.0, 100.0 - (total_pause_time * 5.0) - (pause_count * 10.0))
+    return 0.0
+
+
+# Compile now, at import, instead of on the first /analyze
+find_pauses(np.zeros(1), np.zeros(1), 3.0, 15.0)
+fluency_score(0.0, 0, 0)
@@ -148,8 +148,24 @@ analyzeBtn.onclick = async () => {
             throw new Error(error.error || 'Analysis failed');
         }
 
-        const data = await response.json();
-        displayResults(data);
+        // Transcript arrives first, then one prompt per pause as Claude answers
+        let finished = false;
+        await readEvents(response, (event) => {
+            if (event.type === 'transcript') {
+                displayResults(event);
+            } else if (event.type === 'prompt') {
+                showPrompt(event.index, event.text);
+            } else if (event.type === 'done') {
+                finished = true;
+            } else if (event.type === 'error') {
+                throw new Error(event.error || 'Analysis failed');
+            }
+        });
+
+        // A stream cut off mid-way is a failure, not an empty result
+        if (!finished) {
+            throw new Error('Analysis was interrupted, please try again');
+        }
 
     } catch (err) {
         setStatus('Error: ' + err.message, 'error');
@@ -159,6 +175,27 @@ analyzeBtn.onclick = async () => {
     }
 };
 
+// === READ STREAMED EVENTS ===
+async function readEvents(response, onEvent) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffered = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+
+        buffered += decoder.decode(value, { stream: true });
+        const lines = buffered.split('\n');
+        buffered = lines.pop();
+        lines.filter(line => line.trim()).forEach(line => onEvent(JSON.parse(line)));
+    }
+
+    if (buffered.trim()) {
+        onEvent(JSON.parse(buffered));
+    }
+}
+
 // === DISPLAY RESULTS ===
 function displayResults(data) {
     setStatus('');
@@ -191,7 +228,7 @@ function displayResults(data) {
                         ▶ Watch
                     </button>
                 </div>
-                <div class="ai-prompt">"${escapeHtml(p.ai_prompt)}"</div>
+                <div class="ai-prompt" id="prompt-${i}">Thinking of a prompt...</div>
             </div>
         `).join('');
     } else {
@@ -208,6 +245,14 @@ function displayResults(data) {
     results.scrollIntoView({ behavior: 'smooth', block: 'start' });
 }
 
+// === FILL IN A STREAMED PROMPT ===
+function showPrompt(index, text) {
+    const promptDiv = document.getElementById(`prompt-${index}`);
+    if (promptDiv) {
+        promptDiv.textContent = `"${text}"`;
+    }
+}
+
 // === JUMP TO TIME IN VIDEO ===
 function jumpTo(time) {
     resultVideo.currentTime = Math.max(0, time - 1);
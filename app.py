@@ -8,118 +8,271 @@ Core Insight: High motivation, low ability at the critical moment
 Stack: OpenAI Whisper (free) + Claude API (better conversational tone than GPT-4)
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 import anthropic
+import httpx
 from openai import OpenAI
 from dotenv import load_dotenv
+import av
+from _kernels import find_pauses, fluency_score
+import numpy as np
 import os
-import tempfile
-import subprocess
+import json
+import hashlib
+import io
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 load_dotenv()
 
 app = Flask(__name__)
 CORS(app)
 
-claude = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+# One pooled HTTP/2 connection per worker: concurrent prompt calls from
+# every gthread thread multiplex over it instead of redoing TLS handshakes
+claude = anthropic.Anthropic(
+    api_key=os.getenv("ANTHROPIC_API_KEY"),
+    timeout=30.0,
+    http_client=anthropic.DefaultHttpxClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    )
+)
 whisper_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
+FALLBACK_PROMPT = "What's the main point you want to make?"
+
+# Audio is handled as 16 kHz mono int16 end to end
+SAMPLE_RATE = 16000
+AUDIO_IO_BUFFER = 1 << 20
+
+# Voice activity detection: 30 ms frames quieter than -50 dBFS are silence.
+# Silences of 0.5 s+ are cut before Whisper; speech keeps 0.2 s of padding,
+# and cut regions are rejoined with 1 s of silence between them.
+VAD_FRAME = 480
+VAD_THRESHOLD_DBFS = -50
+VAD_MIN_SILENCE = 0.5
+VAD_PAD = 0.2
+VAD_SEPARATOR = 1.0
+
+# Haiku answers a one-line continuation several times faster than Sonnet.
+# Set CLAUDE_PROMPT_MODEL=claude-sonnet-4-20250514 to A/B against Sonnet.
+PROMPT_MODEL = os.getenv("CLAUDE_PROMPT_MODEL", "claude-haiku-4-5")
+PROMPT_MAX_TOKENS = 40  # per prompt; prompts are under 15 words
+
+PROMPT_SYSTEM = """You help TikTok creators who freeze while recording videos.
+
+You'll get the last 15 seconds of what they said before freezing. Reply with a short prompt (under 15 words) to help them continue naturally.
+
+Rules:
+- Be specific to their topic, not generic
+- Phrase as a question or gentle suggestion
+- Conversational, friendly tone
+- No motivational fluff like "you got this"
+- No generic prompts like "tell us more"
+- Reference something specific they mentioned"""
+
+# Byte lookup for count_words: every ASCII character str.split() treats
+# as whitespace (\t \n \v \f \r, the \x1c-\x1f separators, space)
+_ASCII_SPACE = np.zeros(256, dtype=bool)
+_ASCII_SPACE[[0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x1C, 0x1D, 0x1E, 0x1F, 0x20]] = True
+
+# Creators re-record the same intro and freeze at the same phrase:
+# remember prompts per context so repeats skip Claude entirely
+PROMPT_CACHE_SIZE = 4096
+_prompt_cache = OrderedDict()
+_prompt_cache_lock = threading.Lock()
+
 
 # === CORE FUNCTIONS ===
 
-def transcribe_audio(audio_path: str) -> dict:
-    wav_path = audio_path.replace(".webm", ".wav")
-
-    result = subprocess.run([
-        "ffmpeg", "-y",
-        "-i", audio_path,
-        "-vn", "-acodec", "pcm_s16le",
-        "-ar", "16000", "-ac", "1",
-        wav_path
-    ], capture_output=True, text=True)
-
-    if result.returncode != 0:
-        raise Exception(f"Audio conversion failed: {result.stderr}")
-
-    with open(wav_path, "rb") as audio_file:
-        result = whisper_client.audio.transcriptions.create(
-            model="whisper-1",
-            file=audio_file,
-            response_format="verbose_json",
-            timestamp_granularities=["word"]
-        )
+def decode_audio(audio) -> np.ndarray:
+    """
+    Decode the recording's audio track to 16 kHz mono int16 samples.
+    libav runs in-process via PyAV: no ffmpeg subprocess, no temp file of our own.
+    """
+    try:
+        # 1 MB reads instead of PyAV's 32 KB default: far fewer trips from
+        # libav back into Python for the file-like object
+        with av.open(audio, buffer_size=AUDIO_IO_BUFFER) as container:
+            if not container.streams.audio:
+                raise Exception("Recording has no audio track")
 
-    words = []
-    if hasattr(result, 'words') and result.words:
-        for w in result.words:
-            words.append({
-                "word": w.word,
-                "start": w.start,
-                "end": w.end
-            })
+            # Let libav pick the decoder thread count (ffmpeg's -threads 0)
+            container.streams.audio[0].thread_type = "AUTO"
 
-    if os.path.exists(wav_path):
-        os.remove(wav_path)
+            resampler = av.AudioResampler(format="s16", layout="mono", rate=SAMPLE_RATE)
+            chunks = []
+            for frame in container.decode(audio=0):
+                chunks.extend(f.to_ndarray().reshape(-1) for f in resampler.resample(frame))
+            chunks.extend(f.to_ndarray().reshape(-1) for f in resampler.resample(None))
 
-    return {
-        "text": result.text,
-        "words": words
-    }
+    except av.error.FFmpegError as e:
+        raise Exception(f"Audio conversion failed: {e}")
 
+    return np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int16)
 
-def detect_pauses(words: list, threshold: float = 3.0) -> list:
+
+def encode_speech(samples: np.ndarray) -> bytes:
     """
-    Find gaps > threshold seconds between words.
-    These are the "freeze" moments where creators need help.
+    Encode samples as 24 kbps mono Opus for upload.
+    ~10x fewer bytes than 16-bit PCM WAV, same 16 kHz speech band for Whisper.
+    Kept in memory: nothing written to disk.
+    """
+    buffer = io.BytesIO()
 
-    B=MAT Application:
-    - The pause is the TRIGGER
-    - The prompt reduces ABILITY barrier (mental effort)
-    - Completion drives MOTIVATION for next attempt
+    try:
+        with av.open(buffer, "w", format="ogg", buffer_size=AUDIO_IO_BUFFER) as container:
+            stream = container.add_stream("libopus", rate=SAMPLE_RATE, layout="mono")
+            stream.bit_rate = 24000
+            stream.options = {"application": "voip"}
+
+            frame = av.AudioFrame.from_ndarray(samples.reshape(1, -1), format="s16", layout="mono")
+            frame.sample_rate = SAMPLE_RATE
+
+            for packet in stream.encode(frame):
+                container.mux(packet)
+            for packet in stream.encode(None):
+                container.mux(packet)
+
+    except av.error.FFmpegError as e:
+        raise Exception(f"Audio encoding failed: {e}")
+
+    return buffer.getvalue()
+
+
+def find_speech(samples: np.ndarray) -> list:
     """
-    pauses = []
+    Locate speech as (start, end) sample ranges with a frame-energy VAD.
 
-    for i in range(1, len(words)):
-        gap = words[i]["start"] - words[i-1]["end"]
+    The freezes we're looking for are exactly the stretches Whisper doesn't
+    need to hear: decoding them costs time and invites hallucinated words.
+    """
+    frame_count = len(samples) // VAD_FRAME
+    if frame_count == 0:
+        return []
+
+    frames = samples[:frame_count * VAD_FRAME].reshape(frame_count, VAD_FRAME)
+    rms = np.sqrt(np.mean(frames.astype(np.float32) ** 2, axis=1))
+    voiced = rms >= 32768 * 10 ** (VAD_THRESHOLD_DBFS / 20)
+
+    # Rising/falling edges of the voiced mask -> [start, end) frame runs
+    edges = np.flatnonzero(np.diff(voiced.astype(np.int8), prepend=0, append=0))
+    runs = edges.reshape(-1, 2) * VAD_FRAME
 
-        if gap >= threshold:
-            # Get context: last ~15 seconds before the pause
-            context = get_context_before(words, i, seconds=15)
+    pad = int(VAD_PAD * SAMPLE_RATE)
+    min_silence = int(VAD_MIN_SILENCE * SAMPLE_RATE)
 
-            pauses.append({
-                "pause_start": round(words[i-1]["end"], 2),
-                "pause_end": round(words[i]["start"], 2),
-                "duration": round(gap, 2),
-                "word_before": words[i-1]["word"],
-                "word_after": words[i]["word"],
-                "context_before": context
-            })
+    speech = []
+    for start, end in runs:
+        start, end = max(0, start - pad), min(len(samples), end + pad)
+        if speech and start - speech[-1][1] < min_silence:
+            speech[-1][1] = end
+        else:
+            speech.append([start, end])
 
-    return pauses
+    return [(int(start), int(end)) for start, end in speech]
 
 
-def get_context_before(words: list, index: int, seconds: float = 15) -> str:
+def transcribe_audio(audio) -> dict:
     """
-    Extract transcript text from ~15 seconds before the pause.
-    This context makes prompts SPECIFIC, not generic.
+    Transcribe only the spoken parts of the recording.
 
-    Key insight: Generic prompts ("you got this!") don't help.
-    Context-aware prompts ("what's an example of that?") do.
+    Silences are cut out before upload, then word timestamps are shifted
+    back onto the original timeline so pause detection sees the real gaps.
     """
-    if index == 0:
-        return ""
+    samples = decode_audio(audio)
+    speech = find_speech(samples)
+
+    if not speech:
+        return {"text": "", "tokens": [], "starts": np.empty(0), "ends": np.empty(0)}
+
+    # Where each speech region starts/ends in the cut audio, and how far
+    # it has to shift to land back on the original timeline. Regions are
+    # joined with VAD_SEPARATOR of silence so Whisper's word boundaries
+    # around a cut have room to be off without crossing into a neighbour.
+    lengths = np.array([e - s for s, e in speech]) / SAMPLE_RATE
+    cut_starts = np.concatenate(([0.0], np.cumsum(lengths + VAD_SEPARATOR)[:-1]))
+    cut_ends = cut_starts + lengths
+    shifts = np.array([s for s, _ in speech]) / SAMPLE_RATE - cut_starts
+
+    separator = np.zeros(int(VAD_SEPARATOR * SAMPLE_RATE), dtype=np.int16)
+    pieces = []
+    for start, end in speech:
+        if pieces:
+            pieces.append(separator)
+        pieces.append(samples[start:end])
+
+    audio = encode_speech(np.concatenate(pieces))
+
+    result = whisper_client.audio.transcriptions.create(
+        model="whisper-1",
+        file=("audio.ogg", audio, "audio/ogg"),
+        response_format="verbose_json",
+        timestamp_granularities=["word"]
+    )
+
+    words = result.words if hasattr(result, 'words') and result.words else []
 
-    pause_time = words[index]["start"]
-    cutoff = pause_time - seconds
+    # Struct-of-arrays: word timings live in two float arrays, not per-word
+    # dicts, so pause detection is a couple of vectorized passes
+    starts = np.fromiter((w.start for w in words), dtype=np.float64, count=len(words))
+    ends = np.fromiter((w.end for w in words), dtype=np.float64, count=len(words))
+
+    # Assign each word to a region by its midpoint, not its start: Whisper
+    # word starts are often early, and an early start must not drag the
+    # first word after a freeze back across the cut (erasing the freeze).
+    # A midpoint inside a separator goes to the nearer region.
+    mids = (starts + ends) / 2
+    region = np.maximum(np.searchsorted(cut_starts, mids, side="right") - 1, 0)
+    following = np.minimum(region + 1, len(speech) - 1)
+    nearer_following = ((mids > cut_ends[region])
+                        & (cut_starts[following] - mids < mids - cut_ends[region]))
+    region = np.where(nearer_following, following, region)
+
+    starts = np.clip(starts, cut_starts[region], cut_ends[region]) + shifts[region]
+    ends = np.clip(ends, cut_starts[region], cut_ends[region]) + shifts[region]
+
+    return {
+        "text": result.text,
+        "tokens": [w.word for w in words],
+        "starts": starts,
+        "ends": ends
+    }
+
+
+def detect_pauses(tokens: list, starts: np.ndarray, ends: np.ndarray,
+                  threshold: float = 3.0) -> tuple:
+    """
+    Find gaps > threshold seconds between words.
+    These are the "freeze" moments where creators need help.
+    Returns the pause dicts, plus their durations as an array for metrics.
+
+    B=MAT Application:
+    - The pause is the TRIGGER
+    - The prompt reduces ABILITY barrier (mental effort)
+    - Completion drives MOTIVATION for next attempt
+    """
+    # Get context: last ~15 seconds before each pause, found in the same
+    # sweep that finds the pauses. This context makes prompts SPECIFIC:
+    # "what's an example of that?" helps, "you got this!" doesn't.
+    indices, gaps, firsts = find_pauses(starts, ends, float(threshold), 15.0)
 
-    context_words = []
-    for w in words[:index]:
-        if w["start"] >= cutoff:
-            context_words.append(w["word"])
+    pauses = []
+    for i, first, gap in zip(indices.tolist(), firsts.tolist(), gaps.tolist()):
+        pauses.append({
+            "pause_start": round(float(ends[i-1]), 2),
+            "pause_end": round(float(starts[i]), 2),
+            "duration": round(gap, 2),
+            "word_before": tokens[i-1],
+            "word_after": tokens[i],
+            "context_before": " ".join(tokens[first:i])
+        })
 
-    return " ".join(context_words)
+    return pauses, gaps
 
 
 def generate_prompt(context: str, full_transcript: str = "") -> str:
@@ -139,37 +292,168 @@ def generate_prompt(context: str, full_transcript: str = "") -> str:
     """
 
     if not context or len(context.strip()) < 10:
-        return "What's the main point you want to make?"
+        return FALLBACK_PROMPT
+
+    key = _context_key(context)
+    cached = _cached_prompt(key)
+    if cached is not None:
+        return cached
 
     message = claude.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=100,
+        model=PROMPT_MODEL,
+        max_tokens=PROMPT_MAX_TOKENS,
+        system=PROMPT_SYSTEM,
         messages=[
             {
                 "role": "user",
-                "content": f"""You help TikTok creators who freeze while recording videos.
+                "content": f"""Creator was saying: "{context}"
 
-Given the last 15 seconds of what they said, generate ONE short prompt (under 15 words) to help them continue naturally.
+They froze. Give them a specific prompt to continue (just the prompt, nothing else):"""
+            }
+        ]
+    )
 
-Rules:
-- Be specific to their topic, not generic
-- Phrase as a question or gentle suggestion
-- Conversational, friendly tone
-- No motivational fluff like "you got this"
-- No generic prompts like "tell us more"
-- Reference something specific they mentioned
+    prompt = message.content[0].text.strip().strip('"')
+    _cache_prompt(key, prompt)
 
-Creator was saying: "{context}"
+    return prompt
 
-They froze. Give them a specific prompt to continue (just the prompt, nothing else):"""
+
+def iter_prompts(contexts: list, full_transcript: str = ""):
+    """
+    Yield (index, prompt) for each pause as soon as its prompt is ready.
+
+    A recording with 8 freezes used to pay 8 sequential round-trips.
+    Every uncached context goes to Claude in a SINGLE call, so /analyze
+    latency stays flat no matter how often they froze. If Claude's reply
+    isn't a clean JSON list, fall back to concurrent single-prompt calls.
+
+    Fallback and cached prompts are yielded right away, and a context
+    repeated within one recording is only asked about once.
+    """
+    pending = OrderedDict()  # context key -> indices of pauses sharing it
+
+    for i, context in enumerate(contexts):
+        if not context or len(context.strip()) < 10:
+            yield i, FALLBACK_PROMPT
+            continue
+
+        key = _context_key(context)
+        cached = _cached_prompt(key)
+        if cached is not None:
+            yield i, cached
+        else:
+            pending.setdefault(key, []).append(i)
+
+    if not pending:
+        return
+
+    groups = list(pending.values())
+    unique = [contexts[indices[0]] for indices in groups]
+
+    if len(unique) == 1:
+        ready = [(0, generate_prompt(unique[0], full_transcript))]
+    else:
+        ready = _iter_prompt_batch(unique)
+
+    for n, prompt in ready:
+        for i in groups[n]:
+            yield i, prompt
+
+
+def _iter_prompt_batch(contexts: list):
+    """One Claude call for several contexts; parallel single calls if the reply is malformed."""
+    numbered = "\n".join(
+        f'{n}) "{context}"' for n, context in enumerate(contexts, start=1)
+    )
+
+    message = claude.messages.create(
+        model=PROMPT_MODEL,
+        max_tokens=PROMPT_MAX_TOKENS * len(contexts),
+        system=PROMPT_SYSTEM,
+        messages=[
+            {
+                "role": "user",
+                "content": f"""The creator froze {len(contexts)} times. Here's what they were saying before each freeze:
+
+{numbered}
+
+Give ONE specific prompt per freeze. Return a JSON list of {len(contexts)} prompts, in order (just the JSON list, nothing else):"""
             }
         ]
     )
 
-    return message.content[0].text.strip().strip('"')
+    batch = _parse_prompt_list(message.content[0].text, len(contexts))
+
+    if batch is None:
+        print("Batched prompt reply was malformed, falling back to parallel calls...")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = {pool.submit(generate_prompt, c): n for n, c in enumerate(contexts)}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        return
+
+    for n, (context, prompt) in enumerate(zip(contexts, batch)):
+        _cache_prompt(_context_key(context), prompt)
+        yield n, prompt
+
+
+def _parse_prompt_list(reply: str, expected: int):
+    """Pull the JSON list of prompts out of Claude's reply, or None if malformed."""
+    try:
+        parsed = json.loads(reply[reply.index("["):reply.rindex("]") + 1])
+    except ValueError:
+        return None
+
+    if not isinstance(parsed, list) or len(parsed) != expected:
+        return None
+    if not all(isinstance(p, str) and p.strip() for p in parsed):
+        return None
+
+    return [p.strip().strip('"') for p in parsed]
+
+
+def _context_key(context: str) -> bytes:
+    """Content hash of a context, used as the prompt cache key."""
+    return hashlib.blake2b(context.encode(), digest_size=16).digest()
+
+
+def _cached_prompt(key: bytes):
+    """Look up a cached prompt (or None), marking it recently used."""
+    with _prompt_cache_lock:
+        prompt = _prompt_cache.get(key)
+        if prompt is not None:
+            _prompt_cache.move_to_end(key)
+        return prompt
+
+
+def _cache_prompt(key: bytes, prompt: str):
+    """Remember a prompt, evicting the least recently used past PROMPT_CACHE_SIZE."""
+    with _prompt_cache_lock:
+        _prompt_cache[key] = prompt
+        _prompt_cache.move_to_end(key)
+        if len(_prompt_cache) > PROMPT_CACHE_SIZE:
+            _prompt_cache.popitem(last=False)
+
+
+def count_words(text: str) -> int:
+    """
+    Count whitespace-separated words without building a list of them.
+    One vectorized pass over the UTF-8 bytes: a word starts wherever a
+    non-space byte follows a space (or opens the text).
+
+    Matches len(text.split()) for ASCII whitespace; Unicode-only spaces
+    such as NBSP are not treated as separators.
+    """
+    data = np.frombuffer(text.encode(), dtype=np.uint8)
+    if data.size == 0:
+        return 0
+
+    is_space = _ASCII_SPACE[data]
+    return int(np.count_nonzero(is_space[:-1] & ~is_space[1:])) + int(not is_space[0])
 
 
-def calculate_metrics(transcript: str, pauses: list, prompts_generated: int) -> dict:
+def calculate_metrics(transcript: str, durations: np.ndarray, prompts_generated: int) -> dict:
     """
     Calculate metrics for the practice session.
 
@@ -177,16 +461,24 @@ def calculate_metrics(transcript: str, pauses: list, prompts_generated: int) ->
     - Completion signals → feeds confidence flywheel
     - Pause patterns → data flywheel for ML improvement
     """
-    word_count = len(transcript.split())
-    pause_count = len(pauses)
-    total_pause_time = sum(p["duration"] for p in pauses)
+    word_count = count_words(transcript)
+
+    # Fluent take (the outcome we want most): nothing to add up or penalize
+    if durations.size == 0:
+        return {
+            "word_count": word_count,
+            "pause_count": 0,
+            "total_pause_seconds": 0.0,
+            "prompts_generated": prompts_generated,
+            "fluency_score": 100 if word_count > 0 else 0
+        }
+
+    pause_count = durations.size
+    total_pause_time = float(durations.sum())
 
     # Fluency score: penalize long/frequent pauses
     # This becomes a gamification lever for habit formation
-    if word_count > 0:
-        fluency = max(0, 100 - (total_pause_time * 5) - (pause_count * 10))
-    else:
-        fluency = 0
+    fluency = fluency_score(total_pause_time, pause_count, word_count)
 
     return {
         "word_count": word_count,
@@ -197,6 +489,30 @@ def calculate_metrics(transcript: str, pauses: list, prompts_generated: int) ->
     }
 
 
+def warm_up():
+    """
+    Pay first-request costs at startup instead of on a creator's first take.
+
+    - Runs 1s of silence through the VAD + Opus encode (loads libav/libopus)
+    - Opens keep-alive TLS connections to OpenAI and Anthropic
+    """
+    silence = np.zeros(SAMPLE_RATE, dtype=np.int16)
+    find_speech(silence)
+
+    try:
+        encode_speech(silence)
+    except Exception as e:
+        print(f"Audio warm-up failed: {e}")
+
+    # Short timeout, no retries: under gunicorn this runs in post_fork before
+    # the worker heartbeats, so a hung network must fail fast, not stall it
+    for name, client in (("OpenAI", whisper_client), ("Anthropic", claude)):
+        try:
+            client.with_options(timeout=5.0, max_retries=0).models.list()
+        except Exception as e:
+            print(f"{name} warm-up failed: {e}")
+
+
 # === API ROUTES ===
 
 @app.route("/health", methods=["GET"])
@@ -215,10 +531,19 @@ def analyze():
     2. Transcribe with LOCAL Whisper (word-level timestamps)
     3. Detect pauses > 3 seconds
     4. Generate context-aware prompts with CLAUDE for each pause
-    5. Return results for side-by-side display
+    5. Stream results for side-by-side display
+
+    Response is newline-delimited JSON, one event per line:
+    - {"type": "transcript", ...}  transcript, words, pauses, stats
+    - {"type": "prompt", "index": i, "text": ...}  as each prompt is ready
+    - {"type": "done", "processing_time_seconds": ...}
+    - {"type": "error", "error": ...}  if anything fails after transcription
+    The transcript shows up before Claude has finished.
 
     Privacy Design:
-    - Audio saved to temp file, deleted immediately after processing
+    - Audio decoded in-process, dropped right after transcription
+    - No temp files written by the app; Werkzeug may spool large uploads
+      (>500 KB) to an anonymous temp file, removed when the request ends
     - Nothing stored permanently
     - Encrypted in transit (HTTPS)
     """
@@ -227,38 +552,49 @@ def analyze():
     if "audio" not in request.files:
         return jsonify({"error": "No audio file provided"}), 400
 
-    audio_file = request.files["audio"]
-
-    # Save to temp file (will be deleted)
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".webm") as tmp:
-        audio_path = tmp.name
-        audio_file.save(audio_path)
+    # PyAV reads the upload stream directly: no temp file of our own to write or
+    # clean up, and no second in-memory copy of the whole recording
+    audio = request.files["audio"].stream
 
     try:
         # Step 1: Transcribe with local Whisper
         print("Transcribing with local Whisper...")
-        transcription = transcribe_audio(audio_path)
+        transcription = transcribe_audio(audio)
+
+    except Exception as e:
+        print(f"Error: {e}")
+        return jsonify({"error": str(e)}), 500
 
+    finally:
+        # CRITICAL: Drop the audio immediately
+        # Privacy commitment: nothing stored
+        audio.close()
+
+    return Response(
+        analysis_events(transcription, start_time),
+        mimetype="application/x-ndjson"
+    )
+
+
+def analysis_events(transcription: dict, start_time: float):
+    """
+    Yield the /analyze response as ndjson lines (see analyze()).
+    The 200 is already sent by the time this runs, so any failure is
+    reported as an error event rather than silently cutting the stream.
+    """
+    try:
         # Step 2: Detect pauses
-        pauses = detect_pauses(transcription["words"], threshold=3.0)
-
-        # Step 3: Generate prompts with Claude for each pause
-        print(f"Found {len(pauses)} pauses, generating prompts with Claude...")
-        for pause in pauses:
-            if pause["context_before"]:
-                pause["ai_prompt"] = generate_prompt(
-                    pause["context_before"],
-                    transcription["text"]
-                )
-            else:
-                pause["ai_prompt"] = "What's the main point you want to make?"
-
-        # Step 4: Calculate stats (including duration)
-        duration = transcription["words"][-1]["end"] if transcription["words"] else 0
+        tokens = transcription["tokens"]
+        starts = transcription["starts"]
+        ends = transcription["ends"]
+        pauses, durations = detect_pauses(tokens, starts, ends, threshold=3.0)
+
+        # Step 3: Calculate stats (including duration)
+        duration = float(ends[-1]) if ends.size else 0
 
         metrics = calculate_metrics(
             transcription["text"],
-            pauses,
+            durations,
             len(pauses)
         )
 
@@ -269,26 +605,42 @@ def analyze():
             "pause_count": metrics["pause_count"]
         }
 
-        processing_time = round(time.time() - start_time, 2)
+        yield _event(
+            "transcript",
+            transcript=transcription["text"],
+            words=[
+                {"word": word, "start": start, "end": end}
+                for word, start, end in zip(tokens, starts.tolist(), ends.tolist())
+            ],
+            pauses=pauses,
+            stats=stats
+        )
 
-        return jsonify({
-            "success": True,
-            "transcript": transcription["text"],
-            "words": transcription["words"],
-            "pauses": pauses,
-            "stats": stats,
-            "processing_time_seconds": processing_time
-        })
+        # Step 4: Stream a Claude prompt for each pause as it's ready.
+        # No freezes means no prompts: finish at Whisper speed, skip Claude.
+        if pauses:
+            print(f"Found {len(pauses)} pauses, generating prompts with Claude...")
+            for index, prompt in iter_prompts(
+                [p["context_before"] for p in pauses],
+                transcription["text"]
+            ):
+                yield _event("prompt", index=index, text=prompt)
 
     except Exception as e:
         print(f"Error: {e}")
-        return jsonify({"error": str(e)}), 500
+        yield _event("error", error=str(e))
+        return
+
+    yield _event(
+        "done",
+        success=True,
+        processing_time_seconds=round(time.time() - start_time, 2)
+    )
 
-    finally:
-        # CRITICAL: Delete audio file immediately
-        # Privacy commitment: nothing stored
-        if os.path.exists(audio_path):
-            os.remove(audio_path)
+
+def _event(event_type: str, **fields) -> str:
+    """One ndjson line of the /analyze stream."""
+    return json.dumps({"type": event_type, **fields}) + "\n"
 
 
 @app.route("/quick-prompt", methods=["POST"])
@@ -330,6 +682,8 @@ if __name__ == "__main__":
     print("\nStarting server on http://localhost:5001")
     print("=" * 40 + "\n")
 
+    warm_up()
+
     # Use PORT from environment (for deployment) or 5001 for local
     port = int(os.getenv("PORT", 5001))
     app.run(debug=False, host="0.0.0.0", port=port)
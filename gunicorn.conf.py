@@ -0,0 +1,29 @@
+"""
+Gunicorn config for Confidence Coach.
+
+gthread workers let concurrent /analyze requests overlap their network
+waits (Whisper upload, Claude). preload_app imports app.py once in the
+master, so the Numba kernels compile once and forked workers share those
+pages copy-on-write.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5001')}"
+
+# Half the cores: most of a request is spent waiting on Whisper/Claude,
+# which the threads cover; more processes just compete for the same CPU
+workers = int(os.getenv("WEB_CONCURRENCY", max(1, (os.cpu_count() or 2) // 2)))
+threads = 4
+worker_class = "gthread"
+preload_app = True
+
+# Whisper + Claude on a long recording can outlast the 30s default
+timeout = 120
+
+
+def post_fork(server, worker):
+    # Warm up per worker: connections opened in the master would be
+    # shared by every forked worker
+    from app import warm_up
+    warm_up()